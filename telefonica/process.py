@@ -1,8 +1,67 @@
+import copy
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
-from typing import Dict, Any, List
-from pandas import DataFrame
+from typing import Dict, Any, List, Optional
+import numpy as np
+from pandas import DataFrame, Series, isna, to_numeric
+
+try:
+    import narwhals as nw
+except ImportError:  # narwhals is optional; only needed for non-pandas frames
+    nw = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; float columns fall back to fillna
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fill_nan_inplace(arr, value):
+        """Overwrite NaNs of a 1-d float array with `value` without allocating a mask."""
+        for i in prange(arr.shape[0]):
+            if np.isnan(arr[i]):
+                arr[i] = value
+else:
+    _fill_nan_inplace = None
+
+_INT_DTYPES = ('int8', 'int16', 'int32', 'int64')
+_UINT_DTYPES = ('uint8', 'uint16', 'uint32', 'uint64')
+_CARDINALITY_SAMPLE = 10_000
+_PARALLEL_MIN_COLUMNS = 8
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used instead
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when available, accepting the same inputs as `json.loads`."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. rejects NaN and Infinity); let json decide
+            pass
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _analysis_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool shared by `optimize_dtypes` calls; threads are started lazily on demand."""
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='optimize_dtypes')
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_load_json(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file once per (path, mtime); edits to the file invalidate the entry."""
+    with open(path_str, 'rb') as f:
+        return _json_loads(f.read())
 
 
 class Process:
@@ -56,16 +115,20 @@ class Process:
 
             self.logger.info("Configuration loaded successfully")
         except FileNotFoundError:
-            self.logger.error(f"Parameters file not found at {params_path}")
+            self.logger.error("Parameters file not found at %s", params_path)
             raise
         except KeyError as e:
-            self.logger.error(f"Missing required parameter: {e}")
+            self.logger.error("Missing required parameter: %s", e)
             raise        
 
     @staticmethod
     def _load_json(file_path: Path) -> Dict[str, Any]:
         """
         Load and parse a JSON file.
+
+        Parsed contents are cached per file modification time, so repeated loads of an
+        unchanged file skip the read and parse. A deep copy is returned so callers can
+        mutate the result without affecting the cache.
         
         Args:
             file_path: Path to the JSON file
@@ -78,73 +141,249 @@ class Process:
             FileNotFoundError: If file doesn't exist
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            data = _cached_load_json(str(file_path), file_path.stat().st_mtime_ns)
+            return copy.deepcopy(data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {file_path}: {str(e)}")
         
     @staticmethod
-    def df_size(df: DataFrame) -> float:
+    def df_size(df: DataFrame, deep: bool = True, sample: Optional[int] = None) -> float:
         """
         Calculate the memory size of a DataFrame in megabytes.
         
         Args:
             df: pandas DataFrame to measure
+            deep: If True, count the Python objects held by object columns (O(cells)).
+                If False, only the array buffers are counted (O(columns))
+            sample: If set, measure this many random rows deeply and extrapolate
+                to the full length instead of scanning every object. Requires `deep`
             
         Returns:
             float: Size of the DataFrame in MB
+
+        Raises:
+            ValueError: If `sample` is not a positive integer or is combined with `deep=False`
             
         Example:
             >>> df = pd.DataFrame({'col1': range(1000)})
             >>> Process._df_size(df)
             0.015625  # Size in MB
         """
+        if sample is not None:
+            if isinstance(sample, bool) or not isinstance(sample, int) or sample <= 0:
+                raise ValueError("`sample` must be a positive integer.")
+            if not deep:
+                raise ValueError("`sample` requires `deep=True`.")
+
         try:
+            n_rows = len(df)
+            if sample is not None and sample < n_rows:
+                # Measure the index directly: a sampled index loses RangeIndex compactness
+                rows = df.sample(sample, random_state=0)
+                columns_bytes = rows.memory_usage(index=False, deep=True).sum() * n_rows / len(rows)
+                return (columns_bytes + df.index.memory_usage()) / 1024**2
             # Include index in memory calculation
-            size_mb = df.memory_usage(deep=True).sum() / 1024**2
+            size_mb = df.memory_usage(deep=deep).sum() / 1024**2
             return size_mb
         except Exception as e:
             raise ValueError(f"Error calculating DataFrame size: {str(e)}")
 
-    @staticmethod    
-    def optimize_dtypes(df: DataFrame) -> DataFrame:
-        """Optimize DataFrame memory usage by converting datatypes"""
-        for col in df.columns:
-            # Convert int64 to int32 or int16 if possible
-            if df[col].dtype == 'int64':
-                if df[col].min() >= -32768 and df[col].max() <= 32767:
-                    df[col] = df[col].astype('int16')
-                else:
-                    df[col] = df[col].astype('int32')
-            # Convert object columns to categories if cardinality is low
-            elif df[col].dtype == 'object':
-                if df[col].nunique() / len(df) < 0.5:  # If less than 50% unique values
-                    df[col] = df[col].astype('category')
-        return df
+    @staticmethod
+    def _analyze_col(series: Series, int2uint: bool = False, downcast_float: bool = False) -> Optional[Any]:
+        """
+        Decide the narrowest dtype for a column without modifying it.
+
+        Args:
+            series: Column to analyze
+            int2uint: If True, non-negative integer columns target unsigned types
+            downcast_float: If True, float columns may target float32 (lossy)
+
+        Returns:
+            The target dtype, or None if the column should keep its dtype
+        """
+        kind = series.dtype.kind
+        n_rows = len(series)
+        # Downcast numerics to the smallest subtype that holds the values
+        if kind in 'iu':
+            if isinstance(series.dtype, np.dtype) and n_rows:
+                low, high = series.min(), series.max()
+                candidates = _UINT_DTYPES if int2uint and low >= 0 else _INT_DTYPES
+                for candidate in candidates:
+                    info = np.iinfo(candidate)
+                    if info.min <= low and high <= info.max:
+                        return np.dtype(candidate)
+                return None
+            # Nullable extension and empty columns rely on to_numeric's own rules. The
+            # minimum of an empty or all-NA column is NA, which must not reach a comparison
+            low = series.min()
+            downcast = 'unsigned' if int2uint and not isna(low) and low >= 0 else 'integer'
+            return to_numeric(series, downcast=downcast).dtype
+        if kind == 'f':
+            return to_numeric(series, downcast='float').dtype if downcast_float else None
+        # Convert object columns to categories if cardinality is low. pandas already
+        # stores the codes in the narrowest signed int for the number of categories
+        # (int8 below 128); Categorical does not support unsigned code dtypes
+        if series.dtype == object and n_rows:
+            # A sample's unique ratio overestimates the column's, so a clearly low
+            # sampled ratio is enough to decide; otherwise fall back to the exact count
+            sample_n = min(n_rows, _CARDINALITY_SAMPLE)
+            if sample_n < n_rows:
+                sample = series.sample(sample_n, random_state=0)
+                if sample.nunique(dropna=False) < 0.3 * sample_n:
+                    return 'category'
+            n_unique = series.nunique(dropna=False)
+            if n_unique < 0.5 * n_rows:  # If less than 50% unique values
+                return 'category'
+        return None
+
+    @staticmethod
+    def optimize_dtypes(df: DataFrame, int2uint: bool = False, include: Optional[List[str]] = None,
+                        exclude: Optional[List[str]] = None, max_workers: Optional[int] = None,
+                        downcast_float: bool = False) -> DataFrame:
+        """
+        Optimize DataFrame memory usage by downcasting integer (and optionally float)
+        columns and converting low cardinality object columns to categories.
+
+        Columns are analyzed concurrently (pandas reductions release the GIL) and only the
+        columns whose dtype changes are cast.
+
+        Args:
+            df: pandas DataFrame to optimize
+            int2uint: If True, non-negative integer columns are downcast to unsigned types
+            include: Columns to optimize. Defaults to all columns
+            exclude: Columns to leave untouched
+            max_workers: Threads used for the analysis. Defaults to the number of CPUs.
+                Frames with fewer than 8 columns are analyzed serially
+            downcast_float: If True, float64 columns are downcast to float32 when
+                `pd.to_numeric` accepts it. This is lossy: values only need to match
+                within an absolute tolerance of 5e-4 (e.g. 123.456789 becomes
+                123.456787109375). Defaults to False
+
+        Returns:
+            DataFrame: A new DataFrame with optimized dtypes. `df` is never modified, but
+            columns whose dtype is unchanged are not copied: they share memory with `df`,
+            as in a shallow copy
+        """
+        skip = set(exclude) if exclude else set()
+        columns = [col for col in (df.columns if include is None else include) if col not in skip]
+        if not columns:
+            return df.copy(deep=False)
+
+        workers = max_workers or os.cpu_count() or 1
+        analyze = functools.partial(Process._analyze_col, int2uint=int2uint, downcast_float=downcast_float)
+        # Narrow frames (and per-chunk calls from Table.get_df_optimized) don't amortize
+        # dispatching to threads; the pool itself is shared across calls
+        if workers == 1 or len(columns) < _PARALLEL_MIN_COLUMNS:
+            dtypes = map(analyze, (df[col] for col in columns))
+        else:
+            dtypes = _analysis_executor(workers).map(analyze, (df[col] for col in columns))
+        targets = dict(zip(columns, dtypes))
+
+        targets = {col: dtype for col, dtype in targets.items() if dtype is not None and dtype != df[col].dtype}
+        # Replace only the changed columns on a shallow copy: untouched columns keep their
+        # consolidated blocks and are neither copied nor split one block per column
+        result = df.copy(deep=False)
+        for col, dtype in targets.items():
+            result[col] = df[col].astype(dtype)
+        return result
     
     @staticmethod
     def nulls_imputation(df: DataFrame, columns: List[str], value: Any = 0, 
                          max_factor: float = 2, mean_factor: float = 0.75) -> DataFrame:
-        """Imputate nulls in dataframe providing different logics with memory optimization"""
+        """
+        Imputate nulls in dataframe providing different logics with memory optimization.
+
+        pandas DataFrames are filled in place. Other eager frames (e.g. Polars) are
+        supported when narwhals is installed and are filled by their native engine.
+        """
         if not isinstance(df, DataFrame):
-            raise TypeError("The `df` argument must be a pandas DataFrame object.")
+            if nw is None:
+                raise TypeError("The `df` argument must be a pandas DataFrame object.")
+            return Process._nulls_imputation_native(df, columns, value, max_factor, mean_factor)
         
-        for column in columns:
-            if column not in df.columns:
-                raise ValueError(f"Column `{column}` does not exist in the DataFrame.")
-            
-            if isinstance(value, int):
-                df[column] = df[column].fillna(value)
-            elif value == 'max':
-                max_val = df[column].max()
-                df[column] = df[column].fillna(max_val * max_factor)
-            elif value == 'mean':
-                mean_val = df[column].mean()
-                df[column] = df[column].fillna(mean_val * mean_factor)
-            else:
-                raise ValueError("The `value` argument should be an integer, 'max', or 'mean'.")
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise ValueError(f"Column `{missing[0]}` does not exist in the DataFrame.")
+
+        if isinstance(value, int):
+            fill_values = dict.fromkeys(columns, value)
+        elif value == 'max':
+            fill_values = (df[columns].max() * max_factor).to_dict()
+        elif value == 'mean':
+            fill_values = (df[columns].mean() * mean_factor).to_dict()
+        else:
+            raise ValueError("The `value` argument should be an integer, 'max', or 'mean'.")
+
+        # Float columns whose memory is owned by this frame alone are filled in place by the numba kernel
+        if _fill_nan_inplace is not None:
+            fill_values = {column: fill for column, fill in fill_values.items()
+                           if not Process._fill_float_inplace(df, column, fill)}
+
+        # Single fillna over the remaining columns instead of one per column
+        if fill_values:
+            remaining = list(fill_values)
+            df[remaining] = df[remaining].fillna(fill_values)
         return df
     
+    @staticmethod
+    def _fill_float_inplace(df: DataFrame, column: Any, fill: Any) -> bool:
+        """
+        Fill NaNs of a float32/float64 column in place. Returns False if the column is not eligible.
+
+        The kernel writes straight into the frame's block, so it is only used when no other
+        object can observe that memory: the block must own its buffer (not a view of another
+        frame or of a user array), the frame must not be a slice of another one, and pandas
+        must not track other references to the block (Series, views, shallow copies).
+        Single-block frames are skipped too: `df.values` / `df.to_numpy()` hand out views
+        of that block which pandas does not track. The column is read through the block
+        manager so that no new reference is created.
+        """
+        loc = df.columns.get_loc(column)
+        if not isinstance(loc, (int, np.integer)) or df._is_copy is not None:
+            return False
+        mgr = df._mgr
+        if mgr.nblocks == 1:
+            return False
+        block = mgr.blocks[mgr.blknos[loc]]
+        values = block.values
+        if not isinstance(values, np.ndarray) or values.dtype.type not in (np.float32, np.float64):
+            return False
+        refs = getattr(block, 'refs', None)
+        if not values.flags.owndata or refs is None or refs.has_reference():
+            return False
+        arr = values[mgr.blklocs[loc]]
+        if not (arr.flags.writeable and arr.flags.c_contiguous):
+            return False
+        _fill_nan_inplace(arr, float(fill))
+        return True
+
+    @staticmethod
+    def _nulls_imputation_native(df: Any, columns: List[str], value: Any,
+                                 max_factor: float, mean_factor: float) -> Any:
+        """Fill nulls with `fill_null` through narwhals, keeping the frame's own backend."""
+        try:
+            nw_df = nw.from_native(df, eager_only=True)
+        except TypeError:
+            raise TypeError("The `df` argument must be a pandas DataFrame or a narwhals compatible frame.")
+
+        missing = [column for column in columns if column not in nw_df.columns]
+        if missing:
+            raise ValueError(f"Column `{missing[0]}` does not exist in the DataFrame.")
+
+        if isinstance(value, int):
+            fill_values = dict.fromkeys(columns, value)
+        elif value in ('max', 'mean'):
+            factor = max_factor if value == 'max' else mean_factor
+            aggs = [getattr(nw.col(column), value)() for column in columns]
+            # One scan computes the statistic for every column
+            stats = nw_df.select(aggs).row(0) if columns else ()
+            fill_values = {column: stat * factor for column, stat in zip(columns, stats) if stat is not None}
+        else:
+            raise ValueError("The `value` argument should be an integer, 'max', or 'mean'.")
+
+        nw_df = nw_df.with_columns([nw.col(column).fill_null(fill) for column, fill in fill_values.items()])
+        return nw.to_native(nw_df)
+
     def execute(self) -> None:
         """
         Main execution logic for the process.
@@ -1,7 +1,132 @@
+import functools
+import inspect
 import logging
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Optional, Union
+import numpy as np
+from pandas import CategoricalDtype, DataFrame, concat
+from pandas.api.types import union_categoricals
 from telefonipy.dataman import run_sql_file, get_df_from_query
+from telefonica.process import Process
 
+logger = logging.getLogger(__name__)
+
+_DSN_TO_MOTOR = MappingProxyType({'DWH_TERADATA': 'teradata', 'BIGDATA_CDP': 'hive'})
+
+# Period expression rendered as 'YYYY-MM-DD' text of a fixed type, per engine
+_PERIOD_AS_TEXT = MappingProxyType({
+    'teradata': "CAST(CAST({} AS DATE FORMAT 'YYYY-MM-DD') AS VARCHAR(10))",
+    'hive': "CAST(TO_DATE({}) AS STRING)",
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd(value: str) -> date:
+    """
+    Parse a 'YYYY-MM-DD' string into a date.
+
+    Canonical zero-padded strings are sliced directly, which is much cheaper than
+    `strptime`; anything else goes through `strptime` so accepted inputs are unchanged.
+
+    Raises:
+        ValueError: If the string is not a valid date in 'YYYY-MM-DD' format.
+    """
+    if (len(value) == 10 and value[4] == value[7] == '-'
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return datetime.strptime(value, r"%Y-%m-%d").date()
+
+
+def _as_date(value) -> date:
+    """Return `value` as a date, parsing it with `_parse_ymd` if it is a string."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return _parse_ymd(value)
+
+
+def _is_null_chunk(series) -> bool:
+    """Whether a chunk column carries no type information: `object` with only nulls."""
+    return series.dtype == object and bool(series.isna().all())
+
+
+def _null_chunk_dtype(dtypes: list):
+    """
+    Pick the dtype for all-null chunks of a column from the dtypes of its other chunks.
+
+    Returns None when the other chunks don't agree on something a column of nulls can
+    be cast to, in which case the null chunks stay `object`.
+    """
+    if all(isinstance(dtype, np.dtype) and dtype.kind in 'iuf' for dtype in dtypes):
+        # NaN needs a float; this is the dtype concat promotes the chunks to anyway
+        return np.result_type(np.float32, *dtypes)
+    if all(isinstance(dtype, CategoricalDtype) for dtype in dtypes):
+        return 'category'
+    first = dtypes[0]
+    if all(dtype == first for dtype in dtypes) and first != object and first.kind != 'b':
+        return first
+    return None
+
+
+def _unify_chunk_dtypes(chunks: list) -> None:
+    """
+    Align the dtypes of optimized chunks so `concat` doesn't fall back to `object`.
+
+    All-null `object` chunks of a column (e.g. a numeric column that is entirely NULL in
+    one chunk) are cast to the dtype the other chunks agree on. Then each column that is
+    categorical in some chunk gets the same categories in every chunk; chunks where it
+    stayed `object` are converted to category as well. If the combined categories reach
+    half the total rows (the `optimize_dtypes` threshold) the column is turned back to
+    `object` in every chunk. Chunks are modified in place.
+    """
+    n_rows = sum(len(chunk) for chunk in chunks)
+    for col in chunks[0].columns:
+        nulls = [_is_null_chunk(chunk[col]) for chunk in chunks]
+        typed = [chunk[col].dtype for chunk, null in zip(chunks, nulls) if not null]
+        if typed and any(nulls):
+            target = _null_chunk_dtype(typed)
+            if target is not None:
+                for chunk, null in zip(chunks, nulls):
+                    if null:
+                        chunk[col] = chunk[col].astype(target)
+
+        dtypes = [chunk[col].dtype for chunk in chunks]
+        if not any(isinstance(dtype, CategoricalDtype) for dtype in dtypes):
+            continue
+        if not all(isinstance(dtype, CategoricalDtype) or dtype == object for dtype in dtypes):
+            continue
+        for chunk in chunks:
+            if chunk[col].dtype == object:
+                chunk[col] = chunk[col].astype('category')
+        categories = union_categoricals([chunk[col] for chunk in chunks]).categories
+        if len(categories) >= 0.5 * n_rows:
+            for chunk in chunks:
+                chunk[col] = chunk[col].astype(object)
+            continue
+        for chunk in chunks:
+            chunk[col] = chunk[col].cat.set_categories(categories)
+
+
+def _accepts_keyword(func, name: str) -> bool:
+    """Whether `func` accepts keyword argument `name`, explicitly or through **kwargs."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):  # Not introspectable
+        return False
+    return any(param.name == name or param.kind is param.VAR_KEYWORD for param in parameters)
+
+
+@functools.lru_cache(maxsize=256)
+def _bounds_query(sql_name: str, columns: tuple) -> str:
+    """Build (once per table and columns) the MAX/MIN query used to refresh table bounds."""
+    aggregations = ", ".join(f"MAX({column}), MIN({column})" for column in columns)
+    return f"SELECT {aggregations} FROM {sql_name}"
+
+
+@dataclass(slots=True, eq=False)
 class Table:
     """
     A class to manage and interact with database tables from different data engines.
@@ -20,48 +145,38 @@ class Table:
         min_date (Optional[str]): Minimum date value in the table.
     """
 
-    def __init__(self, name: str, schema: str, dsn: str, period_column: str = None):
+    name: str
+    schema: str
+    dsn: str
+    period_column: Optional[str] = None
+    sql_name: str = field(init=False, default=None)
+    motor: str = field(init=False, default=None)
+    max_period: Optional[str] = field(init=False, default=None)
+    min_period: Optional[str] = field(init=False, default=None)
+    date_column: Optional[str] = field(init=False, default=None)
+    max_date: Optional[str] = field(init=False, default=None)
+    min_date: Optional[str] = field(init=False, default=None)
+    _get_all_query: str = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
         """
-        Initialize a Table instance with name, schema, and DSN.
-
-        Args:
-            name (str): The table name.
-            schema (str): The schema name.
-            dsn (str): Data source name, either 'DWH_TERADATA' or 'BIGDATA_CDP'.
+        Validate the arguments and derive the SQL name and engine.
 
         Raises:
             TypeError: If arguments are not of string type.
             ValueError: If DSN is invalid.
         """
-        if not all(isinstance(arg, str) for arg in [name, schema, dsn]):
+        if not all(isinstance(arg, str) for arg in [self.name, self.schema, self.dsn]):
             raise TypeError("All arguments must be of string type.")
-        if dsn not in ['DWH_TERADATA', 'BIGDATA_CDP']:
+        self.motor = _DSN_TO_MOTOR.get(self.dsn)
+        if self.motor is None:
             raise ValueError("dsn parameter should be 'DWH_TERADATA' or 'BIGDATA_CDP'.")
 
-        self.name = name.strip()
-        self.schema = schema.strip()
-        self.dsn = dsn
-        self.sql_name = f"{self.schema}.{self.name}"
-        self.motor = 'teradata' if dsn == 'DWH_TERADATA' else 'hive'
-        self.period_column = period_column
-        self.max_period = None
-        self.min_period = None
-        self.date_column = None
-        self.max_date = None
-        self.min_date = None
-
-    def __repr__(self):
-        """
-        String representation of the Table instance.
+        self.name = self.name.strip()
+        self.schema = self.schema.strip()
+        self.sql_name = self.schema + '.' + self.name
+        self._get_all_query = "SELECT * FROM " + self.sql_name
 
-        Returns:
-            str: A string containing table details.
-        """
-        return (f"Table(name='{self.name}', schema='{self.schema}', dsn='{self.dsn}', "
-                f"sql_name='{self.sql_name}', motor='{self.motor}', "
-                f"max_period={self.max_period}, min_period={self.min_period}, "
-                f"max_date={self.max_date}, min_date={self.min_date})")
-    
     def query_data(self, query: str):
         """
         Run a query and return the result as a DataFrame.
@@ -77,7 +192,7 @@ class Table:
         """
         if not isinstance(query, str):
             raise TypeError("The 'query' argument must be a string.")
-        logging.info(f"Running query on {self.sql_name}: {query}")
+        logger.info("Running query on %s: %s", self.sql_name, query)
         return get_df_from_query(query, self.dsn)
 
     def update_periods(self, period_column: str):
@@ -93,37 +208,117 @@ class Table:
         """
         if not isinstance(period_column, str):
             raise TypeError("'period_column' must be a string.")
-        self.period_column = period_column
-
-        query = f"SELECT MAX({period_column}), MIN({period_column}) FROM {self.sql_name}"
-        df = self.query_data(query)
-        if df.empty:
-            raise ValueError(f"No data found for column '{period_column}' in table '{self.sql_name}'.")
-
-        self.max_period = str(df.iloc[0, 0])
-        self.min_period = str(df.iloc[0, 1])
-        logging.info(f"Updated periods for {self.sql_name}: max_period={self.max_period}, min_period={self.min_period}")
+        self.update_bounds(period_column=period_column)
 
     def update_dates(self, date_column: str):
         if not isinstance(date_column, str):
             raise TypeError("'date_column' must be a string.")
-        self.date_column = date_column
+        self.update_bounds(date_column=date_column)
 
-        query = f"SELECT MAX({date_column}), MIN({date_column}) FROM {self.sql_name}"
+    def update_bounds(self, period_column: str = None, date_column: str = None):
+        """
+        Update the max and min periods and/or dates of the table with a single query.
+
+        Both aggregations are computed in one round trip, which avoids paying the
+        per-query startup cost of the engine twice (notably on Hive).
+
+        Args:
+            period_column (str, optional): The name of the period column.
+            date_column (str, optional): The name of the date column.
+
+        Raises:
+            TypeError: If a provided column is not a string.
+            ValueError: If no column is provided or the query returns no results.
+        """
+        columns = {'period': period_column, 'date': date_column}
+        columns = {kind: column for kind, column in columns.items() if column is not None}
+        if not columns:
+            raise ValueError("At least one of 'period_column' or 'date_column' must be provided.")
+        for kind, column in columns.items():
+            if not isinstance(column, str):
+                raise TypeError(f"'{kind}_column' must be a string.")
+
+        query = _bounds_query(self.sql_name, tuple(columns.values()))
         df = self.query_data(query)
         if df.empty:
-            raise ValueError(f"No data found for column '{date_column}' in table '{self.sql_name}'.")
+            raise ValueError(f"No data found for columns {list(columns.values())} in table '{self.sql_name}'.")
+
+        # .iat skips the generic indexer machinery for scalar access on the 1xN result
+        position = 0
+        if period_column is not None:
+            self.period_column = period_column
+            self.max_period = str(df.iat[0, position])
+            self.min_period = str(df.iat[0, position + 1])
+            position += 2
+            logger.info("Updated periods for %s: max_period=%s, min_period=%s", self.sql_name, self.max_period, self.min_period)
+        if date_column is not None:
+            self.date_column = date_column
+            self.max_date = str(df.iat[0, position])
+            self.min_date = str(df.iat[0, position + 1])
+            logger.info("Updated dates for %s: max_date=%s, min_date=%s", self.sql_name, self.max_date, self.min_date)
+
+    @classmethod
+    def batch_update_periods(cls, tables: list):
+        """
+        Update the max and min periods of several tables, issuing one query per DSN.
+
+        The per-table aggregations are combined with UNION ALL so each engine pays the
+        query startup cost once. Every aggregate is cast to the same 'YYYY-MM-DD' text
+        type, since the engines take the result column types from the first branch and
+        would otherwise truncate or coerce wider values of later tables. If the engine
+        rejects the combined query (e.g. a period column that is not a date nor a
+        'YYYY-MM-DD' string) the tables are updated one by one.
 
-        self.max_date = str(df.iloc[0, 0])
-        self.min_date = str(df.iloc[0, 1])
-        logging.info(f"Updated dates for {self.sql_name}: max_date={self.max_date}, min_date={self.min_date}")
+        Args:
+            tables (list[Table]): Tables to update. Each must have 'period_column' set.
 
-    def compare_period(self, comparison_period: str, greater: bool = True, max: bool = True) -> bool:
+        Raises:
+            TypeError: If an element is not a Table.
+            ValueError: If a table has no 'period_column' or no results are returned for it.
+        """
+        groups = {}
+        for table in tables:
+            if not isinstance(table, cls):
+                raise TypeError("All elements of 'tables' must be Table instances.")
+            if not table.period_column:
+                raise ValueError(f"The 'period_column' is not set for table '{table.sql_name}'.")
+            groups.setdefault(table.dsn, []).append(table)
+
+        for dsn, group in groups.items():
+            if len(group) == 1:
+                group[0].update_periods(group[0].period_column)
+                continue
+
+            # An integer tag identifies each row, UNION ALL does not guarantee order
+            as_text = _PERIOD_AS_TEXT[group[0].motor]
+            query = " UNION ALL ".join(
+                f"SELECT {i} AS idx, {as_text.format(f'MAX({t.period_column})')}, "
+                f"{as_text.format(f'MIN({t.period_column})')} FROM {t.sql_name}"
+                for i, t in enumerate(group)
+            )
+            logger.info("Running batched period query for %s tables on %s: %s", len(group), dsn, query)
+            try:
+                df = get_df_from_query(query, dsn)
+            except Exception as e:
+                logger.warning("Batched period query failed on %s (%s); updating tables one by one.", dsn, e)
+                for table in group:
+                    table.update_periods(table.period_column)
+                continue
+
+            bounds = {int(idx): (max_period, min_period) for idx, max_period, min_period in df.itertuples(index=False)}
+            for i, table in enumerate(group):
+                if i not in bounds:
+                    raise ValueError(f"No data found for column '{table.period_column}' in table '{table.sql_name}'.")
+                table.max_period = str(bounds[i][0])
+                table.min_period = str(bounds[i][1])
+                logger.info("Updated periods for %s: max_period=%s, min_period=%s", table.sql_name, table.max_period, table.min_period)
+
+    def compare_period(self, comparison_period: Union[str, date], greater: bool = True, max: bool = True) -> bool:
         """
         Compare a given period against the max or min period in the table.
 
         Args:
-            comparison_period (str): The date string to compare in 'YYYY-MM-DD' format.
+            comparison_period (str | date): The date to compare, as a date or a 'YYYY-MM-DD' string.
             greater (bool, optional): Whether to check if the table's period is greater. Defaults to True.
             max (bool, optional): Whether to use the max period (if False, uses min). Defaults to True.
 
@@ -134,7 +329,7 @@ class Table:
             ValueError: If the comparison_period format is invalid, or periods hasn't been set.
         """
         try:
-            comparison_period = datetime.strptime(comparison_period, r"%Y-%m-%d").date()
+            comparison_period = _as_date(comparison_period)
         except ValueError:
             raise ValueError("comparison_period must be in 'YYYY-MM-DD' format.")
 
@@ -143,16 +338,16 @@ class Table:
             raise ValueError(f"The {'max' if max else 'min'} period is not set. Please run 'update_periods' first.")
 
         try:
-            table_period = datetime.strptime(table_period_str, "%Y-%m-%d").date()
+            table_period = _parse_ymd(table_period_str)
         except ValueError:
             raise ValueError(f"{'max' if max else 'min'} period must be in 'YYYY-MM-DD' format.")
         result = comparison_period > table_period if greater else table_period > comparison_period
-        logging.info(f"Comparison result for {comparison_period}: {result}")
+        logger.info("Comparison result for %s: %s", comparison_period, result)
         return result
 
-    def compare_date(self, comparison_date: str, greater: bool = True, max: bool = True) -> bool:
+    def compare_date(self, comparison_date: Union[str, date], greater: bool = True, max: bool = True) -> bool:
         try:
-            comparison_date = datetime.strptime(comparison_date, r"%Y-%m-%d").date()
+            comparison_date = _as_date(comparison_date)
         except ValueError:
             raise ValueError("comparison_date must be in 'YYYY-MM-DD' format.")
 
@@ -160,9 +355,9 @@ class Table:
         if not table_date_str:
             raise ValueError(f"The {'max' if max else 'min'} date is not set. Please run 'update_dates' first.")
 
-        table_date = datetime.strptime(table_date_str, "%Y-%m-%d").date()
+        table_date = _parse_ymd(table_date_str)
         result = comparison_date > table_date if greater else table_date > comparison_date
-        logging.info(f"Comparison result for {comparison_date}: {result}")
+        logger.info("Comparison result for %s: %s", comparison_date, result)
         return result
 
     def get_period_datetime(self, max=True, date=True):
@@ -186,13 +381,13 @@ class Table:
             raise ValueError(f"The {'max' if max else 'min'} period is not set. Please run 'update_periods' first.")
 
         try:
-            # Parse the period into a datetime object
-            period = datetime.strptime(period, r"%Y-%m-%d")
+            # Parse the period into a date object
+            period = _parse_ymd(period)
         except ValueError:
             raise ValueError("The period must be in 'YYYY-MM-DD' format.")
 
         # Return the period as either a date or datetime object
-        return period.date() if date else period
+        return period if date else datetime.combine(period, datetime.min.time())
 
     def run_modification_script(self, file: str, silent: bool = False, params: dict = None):
         """
@@ -214,7 +409,7 @@ class Table:
         if params is not None and not isinstance(params, dict):
             raise TypeError("'params' argument must be a dictionary.")
         
-        logging.info(f"Running modification script '{file}' on {self.sql_name}.")
+        logger.info("Running modification script '%s' on %s.", file, self.sql_name)
         return run_sql_file(file, self.dsn, silent=silent, params=params)
     
     def insert_if(self, period, file, silent=None, params=None):
@@ -239,19 +434,19 @@ class Table:
 
         # Validate date format
         try:
-            datetime.strptime(period, r"%Y-%m-%d").date()
+            parsed_period = _parse_ymd(period)
         except ValueError:
             raise ValueError("The 'period' must be in 'YYYY-MM-DD' format.")
 
         # Check if the insertion is required
-        if self.compare_period(period):
-            logging.info(f"Insertion of period {period} in table {self.name} is required.")
+        if self.compare_period(parsed_period):
+            logger.info("Insertion of period %s in table %s is required.", period, self.name)
             
             # Run the modification script
             self.run_modification_script(file, silent=silent, params=params)
             return True
         else:
-            logging.info(f"Insertion of period {period} in table {self.name} is NOT required.")
+            logger.info("Insertion of period %s in table %s is NOT required.", period, self.name)
             return False
 
     def delete_if(self, period, file, silent=None, params=None):
@@ -275,19 +470,19 @@ class Table:
 
         # Validate date format
         try:
-            datetime.strptime(period, r"%Y-%m-%d").date()
+            parsed_period = _parse_ymd(period)
         except ValueError:
             raise ValueError("The 'period' must be in 'YYYY-MM-DD' format.")
 
         # Check if the deletion is required
-        if self.compare_period(period, greater=True, max=False):
-            logging.info(f"Deletion of period {self.min_period} in table {self.name} is required.")
+        if self.compare_period(parsed_period, greater=True, max=False):
+            logger.info("Deletion of period %s in table %s is required.", self.min_period, self.name)
             
             # Run the modification script
             self.run_modification_script(file, silent=silent, params=params)
             return True
         else:
-            logging.info(f"Deletion of period {self.min_period} in table {self.name} is NOT required.")
+            logger.info("Deletion of period %s in table %s is NOT required.", self.min_period, self.name)
             return False
 
     def get_df(self):
@@ -303,12 +498,59 @@ class Table:
         Returns:
             pandas.DataFrame: A DataFrame representing the entire table.
         """
-        query = f"""
-            SELECT
-                *
-            FROM {self.sql_name}
+        return get_df_from_query(self._get_all_query, self.dsn)
+
+    def get_df_optimized(self, chunksize: int = 200_000, **optimize_kwargs):
         """
-        return get_df_from_query(query, self.dsn)
+        Retrieve the entire table as a pandas DataFrame with memory optimized dtypes.
+
+        Rows are fetched in chunks when the backend supports it and each chunk is passed
+        through `Process.optimize_dtypes` as it arrives. Category columns are recoded to
+        shared categories before concatenating, so they stay categorical and the raw
+        values are only held for one chunk at a time. Numeric columns concatenate to the
+        widest per-chunk dtype, which already fits every value. Only columns that remained
+        `object` in every chunk get a final optimization pass on the concatenated frame.
+
+        Args:
+            chunksize (int, optional): Number of rows per fetched chunk. Defaults to 200000.
+            **optimize_kwargs: Extra arguments for `Process.optimize_dtypes`.
+
+        Returns:
+            pandas.DataFrame: A DataFrame representing the entire table. If the chunked
+            fetch returns no chunks, an empty DataFrame without columns.
+        """
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError("'chunksize' must be a positive integer.")
+
+        if _accepts_keyword(get_df_from_query, 'chunksize'):
+            result = get_df_from_query(self._get_all_query, self.dsn, chunksize=chunksize)
+        else:
+            logger.info("Chunked fetch not supported for %s; fetching the whole table.", self.sql_name)
+            result = self.get_df()
+
+        if isinstance(result, DataFrame):
+            return Process.optimize_dtypes(result, **optimize_kwargs)
+
+        chunks = []
+        exclude = list(optimize_kwargs.get('exclude') or [])
+        for chunk in result:
+            # All-null object columns say nothing about the dtype; they are aligned with
+            # the other chunks in _unify_chunk_dtypes instead of becoming empty categories
+            nulls = [col for col in chunk.columns if _is_null_chunk(chunk[col])]
+            chunks.append(Process.optimize_dtypes(chunk, **{**optimize_kwargs, 'exclude': exclude + nulls}))
+        if not chunks:
+            return DataFrame()
+        _unify_chunk_dtypes(chunks)
+        df = concat(chunks, ignore_index=True, copy=False)
+
+        # Columns that stayed object per chunk may still repeat values across chunks
+        object_columns = [col for col in df.columns if df[col].dtype == object]
+        include = optimize_kwargs.get('include')
+        if include is not None:
+            object_columns = [col for col in object_columns if col in set(include)]
+        if not object_columns:
+            return df
+        return Process.optimize_dtypes(df, **{**optimize_kwargs, 'include': object_columns})
 
     def delete_period(self, period, deletion_file_path, silent=False):
         params_dict = {